@@ -4,10 +4,30 @@ Connects to SolidWorks and extracts assembly information
 """
 
 import win32com.client
+import logging
+import logging.handlers
 import os
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional - metadata falls back to stdlib json
+
+# Batched logger - per-dependency print() calls flush stdout on every line,
+# which dominates the scan loop for large assemblies
+log = logging.getLogger("freezefork.solidworks")
+if not log.handlers:
+    _stream_handler = logging.StreamHandler(sys.stdout)
+    _stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(logging.handlers.MemoryHandler(
+        capacity=256, flushLevel=logging.WARNING, target=_stream_handler
+    ))
+    log.setLevel(logging.INFO)
+
 class SolidWorksConnector:
     def __init__(self):
         self.sw_app = None
@@ -19,12 +39,12 @@ class SolidWorksConnector:
             # Try to connect to existing SolidWorks instance
             self.sw_app = win32com.client.Dispatch("SldWorks.Application")
             self.connected = True
-            print("✅ Connected to SolidWorks")
+            log.info("✅ Connected to SolidWorks")
             return True
             
         except Exception as e:
-            print(f"❌ Failed to connect to SolidWorks: {e}")
-            print("💡 Make sure SolidWorks is running")
+            log.error(f"❌ Failed to connect to SolidWorks: {e}")
+            log.info("💡 Make sure SolidWorks is running")
             return False
     
     def get_active_document(self) -> Optional[object]:
@@ -35,17 +55,17 @@ class SolidWorksConnector:
         try:
             active_doc = self.sw_app.ActiveDoc
             if active_doc is None:
-                print("⚠️  No active document in SolidWorks")
+                log.warning("⚠️  No active document in SolidWorks")
                 return None
                 
             doc_type = active_doc.GetType()
             type_names = {1: "Part", 2: "Assembly", 3: "Drawing"}
-            print(f"📄 Active document type: {type_names.get(doc_type, 'Unknown')}")
+            log.info(f"📄 Active document type: {type_names.get(doc_type, 'Unknown')}")
             
             return active_doc
             
         except Exception as e:
-            print(f"❌ Error getting active document: {e}")
+            log.error(f"❌ Error getting active document: {e}")
             return None
     
     def get_assembly_info(self, doc) -> Dict:
@@ -58,8 +78,8 @@ class SolidWorksConnector:
             doc_path = doc.GetPathName()
             doc_title = doc.GetTitle()
             
-            print(f"📂 Assembly: {doc_title}")
-            print(f"📍 Path: {doc_path}")
+            log.info(f"📂 Assembly: {doc_title}")
+            log.info(f"📍 Path: {doc_path}")
             
             assembly_info = {
                 "name": doc_title,
@@ -80,7 +100,7 @@ class SolidWorksConnector:
             return assembly_info
             
         except Exception as e:
-            print(f"❌ Error extracting assembly info: {e}")
+            log.error(f"❌ Error extracting assembly info: {e}")
             return {}
     
     def get_assembly_dependencies(self, doc) -> List[Dict]:
@@ -88,70 +108,82 @@ class SolidWorksConnector:
         dependencies = []
         
         try:
-            # Get document dependencies
+            # Get document dependencies. The COM tuple commonly repeats the
+            # same part for every instance; dict.fromkeys dedups while
+            # preserving order, and one os.stat per unique path replaces the
+            # separate exists + getsize calls.
             dep_names = doc.GetDependencies2(True, True, False)
-            
-            if dep_names:
-                for dep_path in dep_names:
-                    if dep_path and os.path.exists(dep_path):
-                        file_info = {
-                            "path": dep_path,
-                            "name": os.path.basename(dep_path),
-                            "size": os.path.getsize(dep_path),
-                            "type": self.get_file_type(dep_path),
-                            "exists": True
-                        }
-                        dependencies.append(file_info)
-                        print(f"  📎 Dependency: {file_info['name']}")
-                    else:
-                        # Handle missing files
-                        file_info = {
-                            "path": dep_path,
-                            "name": os.path.basename(dep_path) if dep_path else "Unknown",
-                            "size": 0,
-                            "type": "missing",
-                            "exists": False
-                        }
-                        dependencies.append(file_info)
-                        print(f"  ❌ Missing: {file_info['name']}")
-            
-            print(f"📊 Found {len(dependencies)} dependencies")
+
+            for dep_path in dict.fromkeys(dep_names or ()):
+                try:
+                    st = os.stat(dep_path) if dep_path else None
+                except OSError:
+                    st = None
+
+                if st is not None:
+                    file_info = {
+                        "path": dep_path,
+                        "name": os.path.basename(dep_path),
+                        "size": st.st_size,
+                        "type": self.get_file_type(dep_path),
+                        "exists": True
+                    }
+                    dependencies.append(file_info)
+                    log.info(f"  📎 Dependency: {file_info['name']}")
+                else:
+                    # Handle missing files
+                    file_info = {
+                        "path": dep_path,
+                        "name": os.path.basename(dep_path) if dep_path else "Unknown",
+                        "size": 0,
+                        "type": "missing",
+                        "exists": False
+                    }
+                    dependencies.append(file_info)
+                    log.error(f"  ❌ Missing: {file_info['name']}")
+
+            log.info(f"📊 Found {len(dependencies)} dependencies")
             return dependencies
             
         except Exception as e:
-            print(f"❌ Error getting dependencies: {e}")
+            log.error(f"❌ Error getting dependencies: {e}")
             return []
     
     def build_file_tree(self, doc, dependencies: List[Dict]) -> List[Dict]:
         """Build hierarchical file tree structure"""
         try:
-            # Start with main assembly
+            # Start with main assembly - one stat call instead of
+            # exists + getsize
             main_path = doc.GetPathName()
             main_name = doc.GetTitle()
-            
+
+            try:
+                main_size = os.stat(main_path).st_size
+            except OSError:
+                main_size = 0
+
+            # Dependencies already carry size/exists from the scan, so no
+            # further filesystem calls are needed here
             file_tree = [{
                 "name": main_name,
                 "path": main_path,
                 "type": "assembly",
-                "size": os.path.getsize(main_path) if os.path.exists(main_path) else 0,
-                "children": []
-            }]
-            
-            # Add dependencies as children (simplified structure for now)
-            for dep in dependencies:
-                if dep["exists"]:
-                    child = {
+                "size": main_size,
+                "children": [
+                    {
                         "name": dep["name"],
                         "path": dep["path"],
                         "type": dep["type"],
                         "size": dep["size"]
                     }
-                    file_tree[0]["children"].append(child)
-            
+                    for dep in dependencies if dep["exists"]
+                ]
+            }]
+
             return file_tree
             
         except Exception as e:
-            print(f"❌ Error building file tree: {e}")
+            log.error(f"❌ Error building file tree: {e}")
             return []
     
     def get_file_type(self, file_path: str) -> str:
@@ -178,7 +210,7 @@ class SolidWorksConnector:
             package_dir = os.path.join(output_dir, package_name)
             os.makedirs(package_dir, exist_ok=True)
             
-            print(f"📦 Creating package: {package_dir}")
+            log.info(f"📦 Creating package: {package_dir}")
             
             # Copy main assembly
             main_path = assembly_info["path"]
@@ -186,40 +218,50 @@ class SolidWorksConnector:
                 main_dest = os.path.join(package_dir, os.path.basename(main_path))
                 self._copy_file(main_path, main_dest)
             
-            # Copy all dependencies
-            for dep in assembly_info["dependencies"]:
-                if dep["exists"]:
-                    src_path = dep["path"]
-                    dest_path = os.path.join(package_dir, dep["name"])
-                    self._copy_file(src_path, dest_path)
+            # Copy all dependencies in parallel - the sendfile fast path
+            # releases the GIL, so copies overlap on disk bandwidth
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                for dep in assembly_info["dependencies"]:
+                    if dep["exists"]:
+                        src_path = dep["path"]
+                        dest_path = os.path.join(package_dir, dep["name"])
+                        executor.submit(self._copy_file, src_path, dest_path)
             
-            # Save metadata
-            import json
+            # Save metadata - orjson encodes the assembly tree ~5-10x faster
+            # than stdlib json when available
             metadata_path = os.path.join(package_dir, "assembly_info.json")
-            with open(metadata_path, 'w') as f:
-                json.dump(assembly_info, f, indent=2)
+            if orjson is not None:
+                with open(metadata_path, 'wb') as f:
+                    f.write(orjson.dumps(assembly_info, option=orjson.OPT_INDENT_2))
+            else:
+                import json
+                with open(metadata_path, 'w') as f:
+                    json.dump(assembly_info, f, indent=2)
             
-            print(f"✅ Package created successfully: {package_dir}")
+            log.info(f"✅ Package created successfully: {package_dir}")
             return package_dir
             
         except Exception as e:
-            print(f"❌ Error creating package: {e}")
+            log.error(f"❌ Error creating package: {e}")
             return ""
     
     def _copy_file(self, src: str, dest: str):
         """Copy file with error handling"""
         try:
             import shutil
-            shutil.copy2(src, dest)
-            print(f"  📄 Copied: {os.path.basename(src)}")
+            # copyfile takes the zero-copy fast path (sendfile/CopyFileExW),
+            # keeping bytes in kernel space; copystat preserves timestamps
+            shutil.copyfile(src, dest)
+            shutil.copystat(src, dest)
+            log.info(f"  📄 Copied: {os.path.basename(src)}")
         except Exception as e:
-            print(f"  ❌ Failed to copy {src}: {e}")
+            log.error(f"  ❌ Failed to copy {src}: {e}")
     
     def disconnect(self):
         """Clean up connection"""
         self.sw_app = None
         self.connected = False
-        print("🔌 Disconnected from SolidWorks")
+        log.info("🔌 Disconnected from SolidWorks")
 
 
 # Test function
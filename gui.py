@@ -5,12 +5,24 @@ Simple tkinter interface for the plugin
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import threading
+import collections
+import functools
+import queue
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+
+# Compiled once - parses the legacy "Name (ID: proj-1)" combobox label
+_PROJ_ID_RE = re.compile(r'ID:\s*(?P<id>[^)]+)\)\s*$')
+
+
+@functools.lru_cache(maxsize=1)
+def _default_author():
+    """Default author name, read from the environment once"""
+    return os.getenv('USERNAME', 'SolidWorks User')
 
-from solidworks_connector import SolidWorksConnector
-from api_client import PDMApiClient
 
 class SolidWorksPDMGUI:
     def __init__(self):
@@ -18,19 +30,75 @@ class SolidWorksPDMGUI:
         self.root.title("SolidWorks PDM Plugin")
         self.root.geometry("600x700")
         self.root.resizable(True, True)
-        
-        # Initialize components
-        self.sw_connector = SolidWorksConnector()
-        self.api_client = PDMApiClient()
-        
+
+        # Components are constructed lazily on first use - importing the
+        # COM machinery behind SolidWorksConnector is the slowest part of
+        # cold start, and it isn't needed to show the window
+        self._sw_connector = None
+        self._api_client = None
+
         # Variables
         self.projects = []
+        self._project_id_by_index = []
         self.assembly_info = None
         self.package_dir = ""
+
+        # Package output root, resolved and created once at startup instead
+        # of re-statting the path on every package action
+        self._package_root = Path.home() / "SolidWorksPDM" / "packages"
+        self._package_root.mkdir(parents=True, exist_ok=True)
+
+        # Last-applied option cache per widget - every .configure() is a
+        # Tcl interpreter round-trip, so skip options that haven't changed
+        self._widget_state = {}
+
+        # Tk widgets must only be touched from the main thread; worker
+        # threads enqueue UI updates here and _pump drains them via after()
+        self._ui_queue = queue.Queue()
+
+        # Log lines are buffered and flushed in batches - scans can log
+        # hundreds of lines per second, and one insert per flush keeps the
+        # Text widget from forcing a redraw per line
+        self._log_queue = collections.deque()
+
+        # One persistent worker pool instead of a fresh thread per click -
+        # submission is a queue enqueue, and the bounded size keeps rapid
+        # clicks from spawning unbounded threads
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='pdm-gui')
         
         self.setup_ui()
         self.setup_styles()
-        
+
+        # Release the API client's pooled connections on window close
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    @property
+    def sw_connector(self):
+        """SolidWorks connector, created on first use"""
+        if self._sw_connector is None:
+            from solidworks_connector import SolidWorksConnector
+            self._sw_connector = SolidWorksConnector()
+        return self._sw_connector
+
+    @property
+    def api_client(self):
+        """PDM API client, created on first use"""
+        if self._api_client is None:
+            from api_client import PDMApiClient
+            self._api_client = PDMApiClient()
+        return self._api_client
+
+    def _on_close(self):
+        """Clean up resources when the window is closed"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        try:
+            if self._api_client is not None:
+                self._api_client.close()
+        except Exception:
+            pass
+        self.root.destroy()
+
+
     def setup_styles(self):
         """Configure UI styles"""
         style = ttk.Style()
@@ -153,7 +221,7 @@ class SolidWorksPDMGUI:
         # Author
         ttk.Label(frame, text="Author:").grid(row=1, column=0, sticky=tk.W, pady=(10, 0))
         self.author_entry = ttk.Entry(frame, width=50)
-        self.author_entry.insert(0, os.getenv('USERNAME', 'SolidWorks User'))
+        self.author_entry.insert(0, _default_author())
         self.author_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=(10, 0))
         
         # Upload button
@@ -179,15 +247,49 @@ class SolidWorksPDMGUI:
         frame.columnconfigure(0, weight=1)
         frame.rowconfigure(0, weight=1)
     
+    def _set(self, widget, **kwargs):
+        """Configure a widget with only the options that actually changed"""
+        state = self._widget_state.setdefault(id(widget), {})
+        changed = {k: v for k, v in kwargs.items() if state.get(k) != v}
+        if changed:
+            widget.configure(**changed)
+            state.update(changed)
+
+    def _post(self, fn):
+        """Queue a callable to run on the Tk main thread"""
+        self._ui_queue.put(fn)
+
+    def _pump(self):
+        """Drain queued UI updates on the main thread, then re-arm"""
+        while True:
+            try:
+                fn = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            fn()
+        self.root.after(30, self._pump)
+
     def log_message(self, message):
-        """Add message to log with timestamp"""
+        """Queue a log line for the next batched flush (safe from any thread)"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        
-        self.log_text.insert(tk.END, log_entry)
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
-    
+        self._log_queue.append(f"[{timestamp}] {message}\n")
+
+    def _flush_logs(self):
+        """Insert queued log lines as one batch, then re-arm (main thread only)"""
+        if self._log_queue:
+            entries = []
+            while self._log_queue:
+                entries.append(self._log_queue.popleft())
+            self.log_text.insert(tk.END, "".join(entries))
+            # Trim old lines so a long session doesn't grow the widget
+            # (and every subsequent insert) without bound
+            excess = int(self.log_text.index('end-1c').split('.')[0]) - 5000
+            if excess > 0:
+                self.log_text.delete('1.0', f'{excess + 1}.0')
+            self.log_text.see(tk.END)
+        self.root.after(40, self._flush_logs)
+
+
     def clear_log(self):
         """Clear the log text"""
         self.log_text.delete(1.0, tk.END)
@@ -198,44 +300,49 @@ class SolidWorksPDMGUI:
             self.log_message("Attempting to connect to SolidWorks...")
             
             if self.sw_connector.connect():
-                self.sw_status_label.config(text="Connected", foreground="green")
-                self.sw_connect_btn.config(text="Disconnect", command=self.disconnect_solidworks)
-                self.scan_btn.config(state='normal')
+                def on_connected():
+                    self._set(self.sw_status_label, text="Connected", foreground="green")
+                    self._set(self.sw_connect_btn, text="Disconnect", command=self.disconnect_solidworks)
+                    self._set(self.scan_btn, state='normal')
+                self._post(on_connected)
                 self.log_message("✅ Connected to SolidWorks successfully")
             else:
-                self.sw_status_label.config(text="Failed", foreground="red")
+                self._post(lambda: self._set(self.sw_status_label, text="Failed", foreground="red"))
                 self.log_message("❌ Failed to connect to SolidWorks")
-                messagebox.showerror("Connection Error", 
-                                   "Could not connect to SolidWorks.\nMake sure SolidWorks is running.")
+                self._post(lambda: messagebox.showerror("Connection Error",
+                                   "Could not connect to SolidWorks.\nMake sure SolidWorks is running."))
         
         # Run in separate thread to prevent GUI freezing
-        threading.Thread(target=connect_thread, daemon=True).start()
+        self._pool.submit(connect_thread)
     
     def disconnect_solidworks(self):
         """Disconnect from SolidWorks"""
         self.sw_connector.disconnect()
-        self.sw_status_label.config(text="Not Connected", foreground="red")
-        self.sw_connect_btn.config(text="Connect", command=self.connect_solidworks)
-        self.scan_btn.config(state='disabled')
-        self.package_btn.config(state='disabled')
+        self._set(self.sw_status_label, text="Not Connected", foreground="red")
+        self._set(self.sw_connect_btn, text="Connect", command=self.connect_solidworks)
+        self._set(self.scan_btn, state='disabled')
+        self._set(self.package_btn, state='disabled')
         self.log_message("🔌 Disconnected from SolidWorks")
     
     def test_api(self):
         """Test API connection"""
         def test_thread():
             self.log_message("Testing API connection...")
-            
-            if self.api_client.test_connection():
-                self.api_status_label.config(text="Connected", foreground="green")
+
+            # One concurrent round-trip pair instead of health-then-projects
+            # in series - the project list arrives with the health verdict
+            healthy, projects = self.api_client.check_health_and_projects()
+            if healthy:
+                self._post(lambda: self._set(self.api_status_label, text="Connected", foreground="green"))
                 self.log_message("✅ API connection successful")
-                self.load_projects()
+                self._apply_projects(projects)
             else:
-                self.api_status_label.config(text="Failed", foreground="red")
+                self._post(lambda: self._set(self.api_status_label, text="Failed", foreground="red"))
                 self.log_message("❌ API connection failed")
-                messagebox.showerror("API Error", 
-                                   "Could not connect to PDM API.\nCheck your internet connection.")
+                self._post(lambda: messagebox.showerror("API Error",
+                                   "Could not connect to PDM API.\nCheck your internet connection."))
         
-        threading.Thread(target=test_thread, daemon=True).start()
+        self._pool.submit(test_thread)
     
     def scan_assembly(self):
         """Scan the active SolidWorks assembly"""
@@ -243,180 +350,194 @@ class SolidWorksPDMGUI:
             self.log_message("Scanning active assembly...")
             
             if not self.sw_connector.connected:
-                messagebox.showerror("Error", "Not connected to SolidWorks")
+                self._post(lambda: messagebox.showerror("Error", "Not connected to SolidWorks"))
                 return
-            
+
             active_doc = self.sw_connector.get_active_document()
             if not active_doc:
-                messagebox.showerror("Error", "No active document in SolidWorks")
+                self._post(lambda: messagebox.showerror("Error", "No active document in SolidWorks"))
                 return
-            
+
             # Check if it's an assembly
             doc_type = active_doc.GetType()
             if doc_type != 2:  # 2 = Assembly
-                messagebox.showwarning("Warning", "Active document is not an assembly")
+                self._post(lambda: messagebox.showwarning("Warning", "Active document is not an assembly"))
                 return
-            
+
             self.assembly_info = self.sw_connector.get_assembly_info(active_doc)
-            
+
             if self.assembly_info:
-                self.display_assembly_info()
-                self.package_btn.config(state='normal')
+                def on_scanned():
+                    self.display_assembly_info()
+                    self._set(self.package_btn, state='normal')
+                self._post(on_scanned)
                 self.log_message(f"✅ Assembly scanned: {self.assembly_info['name']}")
             else:
                 self.log_message("❌ Failed to scan assembly")
         
-        threading.Thread(target=scan_thread, daemon=True).start()
+        self._pool.submit(scan_thread)
     
     def display_assembly_info(self):
         """Display assembly information in the text widget"""
         if not self.assembly_info:
             return
         
-        info_text = f"Assembly: {self.assembly_info['name']}\n"
-        info_text += f"Path: {self.assembly_info['path']}\n"
-        info_text += f"Dependencies: {len(self.assembly_info['dependencies'])}\n\n"
-        
-        info_text += "Files:\n"
-        for dep in self.assembly_info['dependencies']:
-            status = "✅" if dep['exists'] else "❌"
-            info_text += f"  {status} {dep['name']} ({dep['size']} bytes)\n"
-        
-        self.assembly_info_text.delete(1.0, tk.END)
-        self.assembly_info_text.insert(1.0, info_text)
+        # Build the whole buffer with one join (repeated += is O(n^2)) and
+        # swap the widget contents with a single atomic replace instead of
+        # delete + insert
+        rows = [
+            f"  {'✅' if dep['exists'] else '❌'} {dep['name']} ({dep['size']} bytes)"
+            for dep in self.assembly_info['dependencies']
+        ]
+        info_text = (
+            f"Assembly: {self.assembly_info['name']}\n"
+            f"Path: {self.assembly_info['path']}\n"
+            f"Dependencies: {len(self.assembly_info['dependencies'])}\n\n"
+            "Files:\n" + "\n".join(rows) + "\n"
+        )
+
+        self.assembly_info_text.replace('1.0', tk.END, info_text)
     
     def create_package(self):
         """Create assembly package"""
         def package_thread():
             if not self.assembly_info:
-                messagebox.showerror("Error", "No assembly information available")
+                self._post(lambda: messagebox.showerror("Error", "No assembly information available"))
                 return
-            
+
             self.log_message("Creating assembly package...")
-            
-            # Create package in temp directory
-            temp_dir = os.path.join(os.path.expanduser("~"), "SolidWorksPDM", "packages")
-            os.makedirs(temp_dir, exist_ok=True)
-            
-            self.package_dir = self.sw_connector.save_assembly_package(self.assembly_info, temp_dir)
-            
+
+            # Package root is resolved and created once in __init__
+            self.package_dir = self.sw_connector.save_assembly_package(
+                self.assembly_info, str(self._package_root))
+
             if self.package_dir:
                 self.log_message(f"✅ Package created: {self.package_dir}")
-                self.upload_btn.config(state='normal')
+                self._post(lambda: self._set(self.upload_btn, state='normal'))
             else:
                 self.log_message("❌ Failed to create package")
         
-        threading.Thread(target=package_thread, daemon=True).start()
+        self._pool.submit(package_thread)
     
     def load_projects(self):
         """Load projects from API"""
         def load_thread():
             self.log_message("Loading projects...")
-            
-            self.projects = self.api_client.get_projects()
-            
-            if self.projects:
-                project_names = [f"{p['name']} (ID: {p['id']})" for p in self.projects]
-                self.project_combo['values'] = project_names
-                
-                if project_names:
-                    self.project_combo.current(0)
-                
-                self.log_message(f"✅ Loaded {len(self.projects)} projects")
-            else:
-                self.project_combo['values'] = []
-                self.log_message("No projects found")
-        
-        threading.Thread(target=load_thread, daemon=True).start()
+            self._apply_projects(self.api_client.get_projects())
+
+        self._pool.submit(load_thread)
+
+    def _apply_projects(self, projects):
+        """Publish a fetched project list to the UI (safe from any thread)"""
+        def on_loaded():
+            self.projects = projects
+            # Keep ids in a parallel list so selection is an O(1) index
+            # lookup instead of re-parsing the display label
+            self._project_id_by_index = [p['id'] for p in projects]
+            self.project_combo['values'] = [p['name'] for p in projects]
+            if projects:
+                self.project_combo.current(0)
+        self._post(on_loaded)
+
+        if projects:
+            self.log_message(f"✅ Loaded {len(projects)} projects")
+        else:
+            self.log_message("No projects found")
     
     def create_new_project(self):
         """Create a new project"""
+        # Read the entry on the main thread before handing off
+        project_name = self.new_project_entry.get().strip()
+        if not project_name:
+            messagebox.showerror("Error", "Please enter a project name")
+            return
+
         def create_thread():
-            project_name = self.new_project_entry.get().strip()
-            if not project_name:
-                messagebox.showerror("Error", "Please enter a project name")
-                return
-            
             self.log_message(f"Creating project: {project_name}")
-            
+
             project = self.api_client.create_project(project_name, "Created from SolidWorks plugin")
-            
+
             if project:
-                self.new_project_entry.delete(0, tk.END)
+                self._post(lambda: self.new_project_entry.delete(0, tk.END))
                 self.load_projects()  # Refresh project list
                 self.log_message(f"✅ Project created: {project['name']}")
             else:
                 self.log_message("❌ Failed to create project")
-        
-        threading.Thread(target=create_thread, daemon=True).start()
+
+        self._pool.submit(create_thread)
     
     def get_selected_project_id(self):
         """Get the ID of the selected project"""
-        selection = self.project_var.get()
-        if not selection:
-            return None
-        
-        # Extract ID from the selection string
-        try:
-            # Format is "Name (ID: proj-1)"
-            start = selection.rfind("ID: ") + 4
-            end = selection.rfind(")")
-            return selection[start:end]
-        except:
-            return None
+        idx = self.project_combo.current()
+        if 0 <= idx < len(self._project_id_by_index):
+            return self._project_id_by_index[idx]
+        # Free-typed text doesn't map to an index; fall back to parsing an
+        # old-style "Name (ID: proj-1)" label if that's what was pasted in
+        m = _PROJ_ID_RE.search(self.project_var.get())
+        return m.group('id') if m else None
     
     def upload_assembly(self):
         """Upload assembly to PDM"""
+        # Validate inputs on the main thread before handing off
+        project_id = self.get_selected_project_id()
+        if not project_id:
+            messagebox.showerror("Error", "Please select a project")
+            return
+
+        commit_message = self.commit_entry.get().strip()
+        if not commit_message:
+            messagebox.showerror("Error", "Please enter a commit message")
+            return
+
+        author = self.author_entry.get().strip()
+        if not author:
+            author = "SolidWorks User"
+
+        if not self.package_dir or not os.path.exists(self.package_dir):
+            messagebox.showerror("Error", "No package available. Please create package first.")
+            return
+
+        self.log_message(f"Uploading to project {project_id}...")
+        self._set(self.upload_btn, state='disabled', text='Uploading...')
+
+        def on_progress(sent, total):
+            # Runs on the upload thread; _set dedups repeated percentages so
+            # only real changes cross to the main loop
+            pct = int(sent * 100 / total) if total else 0
+            self._post(lambda: self._set(self.upload_btn, text=f'Uploading... {pct}%'))
+
         def upload_thread():
-            # Validate inputs
-            project_id = self.get_selected_project_id()
-            if not project_id:
-                messagebox.showerror("Error", "Please select a project")
-                return
-            
-            commit_message = self.commit_entry.get().strip()
-            if not commit_message:
-                messagebox.showerror("Error", "Please enter a commit message")
-                return
-            
-            author = self.author_entry.get().strip()
-            if not author:
-                author = "SolidWorks User"
-            
-            if not self.package_dir or not os.path.exists(self.package_dir):
-                messagebox.showerror("Error", "No package available. Please create package first.")
-                return
-            
-            self.log_message(f"Uploading to project {project_id}...")
-            self.upload_btn.config(state='disabled', text='Uploading...')
-            
             try:
                 result = self.api_client.upload_assembly(
-                    project_id, 
-                    self.assembly_info, 
-                    self.package_dir, 
-                    commit_message, 
-                    author
+                    project_id,
+                    self.assembly_info,
+                    self.package_dir,
+                    commit_message,
+                    author,
+                    progress_callback=on_progress
                 )
-                
+
                 if result:
                     self.log_message(f"✅ Upload successful: {result.get('id', 'Unknown')}")
-                    messagebox.showinfo("Success", "Assembly uploaded successfully!")
-                    
-                    # Clear form
-                    self.commit_entry.delete(0, tk.END)
-                    self.assembly_info_text.delete(1.0, tk.END)
+
+                    def on_uploaded():
+                        messagebox.showinfo("Success", "Assembly uploaded successfully!")
+                        # Clear form
+                        self.commit_entry.delete(0, tk.END)
+                        self.assembly_info_text.delete(1.0, tk.END)
+                        self._set(self.package_btn, state='disabled')
+                    self._post(on_uploaded)
+
                     self.assembly_info = None
                     self.package_dir = ""
-                    self.package_btn.config(state='disabled')
                 else:
                     self.log_message("❌ Upload failed")
-                    messagebox.showerror("Error", "Upload failed. Check the log for details.")
-            
+                    self._post(lambda: messagebox.showerror("Error", "Upload failed. Check the log for details."))
+
             finally:
-                self.upload_btn.config(state='normal', text='Upload Assembly')
-        
-        threading.Thread(target=upload_thread, daemon=True).start()
+                self._post(lambda: self._set(self.upload_btn, state='normal', text='Upload Assembly'))
+
+        self._pool.submit(upload_thread)
     
     def run(self):
         """Start the GUI application"""
@@ -426,7 +547,12 @@ class SolidWorksPDMGUI:
         self.log_message("3. Open an assembly in SolidWorks")
         self.log_message("4. Scan assembly and create package")
         self.log_message("5. Select/create project and upload")
-        
+
+        # Start draining worker-thread UI updates and batched log lines on
+        # the main thread
+        self._pump()
+        self._flush_logs()
+
         # Auto-test API connection on startup
         self.test_api()
         
@@ -1,11 +1,64 @@
 # app/main.py - Ultra Simple Version
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+import collections
+import hashlib
+import itertools
 import json
+import logging
 import os
-from datetime import datetime
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 
-app = FastAPI(title="SolidWorks PDM API", version="1.0.0")
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional - serialization falls back to stdlib json
+
+def _dumps(obj) -> bytes:
+    """Serialize to JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+# Timestamps only need 1-second granularity, so format once per second
+# instead of allocating a datetime per request (utcnow() is also deprecated
+# since 3.12)
+_last_ts = [0, ""]
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string, cached per second"""
+    t = int(time.time())
+    if t != _last_ts[0]:
+        _last_ts[0] = t
+        _last_ts[1] = datetime.fromtimestamp(t, tz=timezone.utc) \
+            .isoformat().replace("+00:00", "Z")
+    return _last_ts[1]
+
+@asynccontextmanager
+async def lifespan(app):
+    # Warm the serialized-response caches per worker so the first request
+    # doesn't pay for them, and log the timing so precompute regressions
+    # show up in the startup logs
+    t0 = time.perf_counter()
+    _get_projects_blob()
+    _get_projects_etag()
+    for project_id in commits_data:
+        _get_commits_blob(project_id)
+    logging.getLogger("uvicorn.error").info(
+        "Precomputed response caches in %.1f ms", (time.perf_counter() - t0) * 1000)
+    yield
+
+# Handlers that still return dicts/lists skip the stdlib json encoder when
+# orjson is installed
+app = FastAPI(
+    title="SolidWorks PDM API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
+    lifespan=lifespan,
+)
 
 # CORS
 app.add_middleware(
@@ -16,6 +69,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress the JSON payloads - repeated field names, timestamps and hex
+# colors shrink 5-10x, and requests-based clients decompress transparently.
+# Brotli is ~20% smaller on JSON when brotli-asgi is installed.
+try:
+    from brotli_asgi import BrotliMiddleware
+    app.add_middleware(BrotliMiddleware, minimum_size=512)
+except ImportError:
+    from fastapi.middleware.gzip import GZipMiddleware
+    app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 # Simple data storage
 projects_data = [
     {
@@ -169,24 +232,125 @@ def root():
 def health():
     return {"status": "healthy", "projects": len(projects_data)}
 
+# Index projects by id (commits already are) so single-project lookups and
+# validation are O(1), and allocate ids from a monotonic counter - deriving
+# them from len(projects_data) would collide after any future deletion
+_projects_by_id = {p["id"]: p for p in projects_data}
+_next_proj_id = itertools.count(len(projects_data) + 1)
+
+# The project list only changes on create_project, so serialize it once and
+# serve the cached bytes - the hot GET path collapses to a memcpy. The weak
+# ETag is computed over the same blob for bodyless 304 revalidation.
+_projects_blob = None
+_projects_etag = None
+
+def _get_projects_blob() -> bytes:
+    global _projects_blob
+    if _projects_blob is None:
+        _projects_blob = _dumps(projects_data)
+    return _projects_blob
+
+def _get_projects_etag():
+    global _projects_etag
+    if _projects_etag is None:
+        digest = hashlib.blake2b(_get_projects_blob(), digest_size=8).hexdigest()
+        _projects_etag = f'W/"{digest}"'
+    return _projects_etag
+
+def _invalidate_projects_cache():
+    global _projects_blob, _projects_etag
+    _projects_blob = None
+    _projects_etag = None
+
+# Commit timelines get polled by the frontend every few seconds, so cache
+# their serialized form per project. A short TTL plus an LRU bound keeps the
+# cache correct even if a future mutation path forgets to invalidate, and
+# keeps memory flat as the project count grows.
+_COMMITS_TTL = 2.0
+_COMMITS_CACHE_MAX = 128
+_commits_cache = collections.OrderedDict()
+
+def _get_commits_blob(project_id: str) -> bytes:
+    now = time.monotonic()
+    entry = _commits_cache.get(project_id)
+    if entry is not None and now - entry[0] < _COMMITS_TTL:
+        _commits_cache.move_to_end(project_id)
+        return entry[1]
+    blob = _dumps(commits_data.get(project_id, []))
+    _commits_cache[project_id] = (now, blob)
+    _commits_cache.move_to_end(project_id)
+    while len(_commits_cache) > _COMMITS_CACHE_MAX:
+        _commits_cache.popitem(last=False)
+    return blob
+
+def _invalidate_commits(project_id: str):
+    """Drop the cached commits blob after a mutation (future commit POSTs)"""
+    _commits_cache.pop(project_id, None)
+
+# Short max-age so caching clients (requests-cache / CacheControl) can serve
+# rapid repeat GETs locally; create_project invalidation plus the ETag keeps
+# staleness bounded to a few seconds
+_CACHE_HEADERS = {"Cache-Control": "public, max-age=5"}
+
 @app.get("/api/v1/projects")
-def get_projects():
-    return projects_data
+def get_projects(request: Request):
+    etag = _get_projects_etag()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    return Response(content=_get_projects_blob(), media_type="application/json",
+                    headers={"ETag": etag, **_CACHE_HEADERS})
+
+@app.post("/api/v1/projects/refresh")
+def refresh_projects():
+    _invalidate_projects_cache()
+    return {"status": "refreshed"}
+
+@app.get("/api/v1/projects/{project_id}")
+def get_project(project_id: str):
+    project = _projects_by_id.get(project_id)
+    if project is None:
+        return Response(status_code=404)
+    return project
 
 @app.get("/api/v1/projects/{project_id}/commits")
 def get_commits(project_id: str):
-    return commits_data.get(project_id, [])
+    return Response(content=_get_commits_blob(project_id),
+                    media_type="application/json",
+                    headers=_CACHE_HEADERS)
 
 @app.post("/api/v1/projects")
 def create_project(project: dict):
     new_project = {
-        "id": f"proj-{len(projects_data) + 1}",
+        "id": f"proj-{next(_next_proj_id)}",
         "name": project.get("name", "New Project"),
         "description": project.get("description", ""),
-        "lastModified": datetime.utcnow().isoformat(),
+        "lastModified": _now_iso(),
         "branches": [{"id": "main", "name": "main", "commitCount": 0, "color": "#3b82f6"}],
         "totalCommits": 0,
         "contributors": []
     }
     projects_data.append(new_project)
-    return new_project
\ No newline at end of file
+    _projects_by_id[new_project["id"]] = new_project
+    _invalidate_projects_cache()
+    return new_project
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop and httptools replace the pure-Python event loop and h11 parser
+    # with C-backed implementations; request them explicitly when installed
+    # and let uvicorn pick the defaults otherwise. Keep a single worker:
+    # projects_data and the response caches live in process memory, so with
+    # multiple workers a POST /projects would land in one process and GETs
+    # answered by the others would miss the new project. Bump workers only
+    # once the data moves to shared storage.
+    try:
+        import uvloop  # noqa: F401
+        import httptools  # noqa: F401
+        loop, http = "uvloop", "httptools"
+    except ImportError:
+        loop, http = "auto", "auto"
+
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, workers=1,
+                loop=loop, http=http, log_level="warning")
\ No newline at end of file